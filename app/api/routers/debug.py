@@ -1,9 +1,49 @@
 from fastapi import APIRouter
 import os
+import time
 from pathlib import Path
 
+from app.services import data_service
+
 router = APIRouter(prefix="/debug", tags=["Debug"])
 
+# Resolve data paths once at import instead of on every request
+_HERE = Path(__file__).resolve().parent
+DATA_DIR = _HERE.parent.parent / "data"
+_DATA_DIR_STR = str(DATA_DIR)
+
+# These paths never change for the lifetime of the process; the questions
+# file is read from the data service since set_questions_file can move it
+_ENV_PATHS = {
+    "current_dir": str(Path.cwd()),
+    "file_dir": str(_HERE),
+    "data_dir": _DATA_DIR_STR,
+}
+
+# File system checks can change (e.g. first question creates the file), so only cache briefly
+_FILE_SYSTEM_TTL = 5.0
+_file_system_cache = {"expires": 0.0, "questions_path": None, "data": None}
+
+
+def _file_system_info() -> dict:
+    """Return data directory checks, recomputed at most every few seconds."""
+    now = time.monotonic()
+    questions_path = data_service.questions_path
+    if now >= _file_system_cache["expires"] or questions_path != _file_system_cache["questions_path"]:
+        try:
+            os.stat(_DATA_DIR_STR)
+            data_dir_exists = True
+        except FileNotFoundError:
+            data_dir_exists = False
+        _file_system_cache["data"] = {
+            "data_dir_exists": data_dir_exists,
+            "questions_file_exists": os.path.exists(questions_path),
+            "data_dir_writable": os.access(_DATA_DIR_STR, os.W_OK) if data_dir_exists else False,
+        }
+        _file_system_cache["questions_path"] = questions_path
+        _file_system_cache["expires"] = now + _FILE_SYSTEM_TTL
+    return _file_system_cache["data"]
+
 
 @router.get("/env", summary="Check environment variables", operation_id="check_environment")
 async def check_environment():
@@ -11,17 +51,8 @@ async def check_environment():
     Debug endpoint to check environment variables and system info.
     """
     return {
-        "paths": {
-            "current_dir": str(Path.cwd()),
-            "file_dir": str(Path(__file__).parent),
-            "data_dir": str(Path(__file__).parent.parent.parent / "data"),
-            "questions_file": str(Path(__file__).parent.parent.parent / "data" / "questions.json"),
-        },
-        "file_system": {
-            "data_dir_exists": (Path(__file__).parent.parent.parent / "data").exists(),
-            "questions_file_exists": (Path(__file__).parent.parent.parent / "data" / "questions.json").exists(),
-            "data_dir_writable": os.access(str(Path(__file__).parent.parent.parent / "data"), os.W_OK) if (Path(__file__).parent.parent.parent / "data").exists() else False,
-        }
+        "paths": {**_ENV_PATHS, "questions_file": data_service.questions_path},
+        "file_system": _file_system_info(),
     }
 
 
@@ -30,23 +61,19 @@ async def check_file_contents():
     """
     Debug endpoint to check the contents of the questions file.
     """
-    import json
-    
-    questions_file = Path(__file__).parent.parent.parent / "data" / "questions.json"
-    
+    questions_path = data_service.questions_path
     result = {
-        "file_path": str(questions_file),
-        "file_exists": questions_file.exists(),
+        "file_path": questions_path,
+        "file_exists": os.path.exists(questions_path),
         "questions": [],
         "error": None
     }
     
-    if questions_file.exists():
+    if result["file_exists"]:
         try:
-            with open(questions_file, 'r', encoding='utf-8') as f:
-                questions = json.load(f)
-                result["questions"] = questions
-                result["total_count"] = len(questions)
+            questions = data_service.questions_data
+            result["questions"] = questions
+            result["total_count"] = len(questions)
         except Exception as e:
             result["error"] = str(e)
     
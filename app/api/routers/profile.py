@@ -1,31 +1,44 @@
-from fastapi import APIRouter, Query, HTTPException, Request
-from typing import Optional, List
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import APIRouter, Depends, Query, Response
+from typing import Optional
 
+from app.json_codec import json_dumps
 from app.models import Profile, Quote
-from app.services import profile_service, create_error_response
+from app.rate_limit import TokenBucket
+from app.services import profile_service
 
-# Rate limiter instance  
-limiter = Limiter(key_func=get_remote_address)
+# Token bucket rate limiters
+profile_limit = TokenBucket(60)  # Allow 60 requests per minute
+quote_limit = TokenBucket(30)  # Allow 30 quote requests per minute
 router = APIRouter(prefix="/profile", tags=["Profile"])
 
 
-@router.get("", response_model=Profile, summary="Get profile information", operation_id="get_profile")
-@limiter.limit("60/minute")  # Allow 60 requests per minute
-async def get_profile(request: Request):
+def _serialized_quote(topic: Optional[str]) -> bytes:
+    """Quote JSON body for a topic."""
+    return json_dumps(profile_service.get_quote(topic=topic).model_dump())
+
+
+_PROFILE_BODY = json_dumps(profile_service.get_profile().model_dump())
+# Bodies for the known topics; any other topic is encoded per request
+_QUOTE_BODY_BY_TOPIC = {
+    topic: _serialized_quote(topic)
+    for topic in (None, *profile_service.data_service.quotes_models)
+}
+
+
+@router.get("", response_model=Profile, summary="Get profile information", operation_id="get_profile",
+            dependencies=[Depends(profile_limit)])
+async def get_profile():
     """
     Get the main profile information.
     
     **Rate limit:** 60 requests per minute per IP address
     """
-    return profile_service.get_profile()
+    return Response(content=_PROFILE_BODY, media_type="application/json")
 
 
-@router.get("/quotes", response_model=Quote, summary="Get a quote", operation_id="get_quote")  
-@limiter.limit("30/minute")  # Allow 30 quote requests per minute
+@router.get("/quotes", response_model=Quote, summary="Get a quote", operation_id="get_quote",
+            dependencies=[Depends(quote_limit)])
 async def get_quote(
-    request: Request,
     topic: Optional[str] = Query(None, description="Quote topic (e.g., general, ai)")
 ):
     """
@@ -33,4 +46,7 @@ async def get_quote(
     
     Available topics: general, ai
     """
-    return profile_service.get_quote(topic=topic)
\ No newline at end of file
+    body = _QUOTE_BODY_BY_TOPIC.get(topic)
+    if body is None:
+        body = _serialized_quote(topic)
+    return Response(content=body, media_type="application/json")
\ No newline at end of file
@@ -1,11 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from typing import List
 
+from app.json_codec import json_list_body
 from app.models import Project, ProjectsList
 from app.services import projects_service
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
+_PROJECTS_BODY = json_list_body("projects", projects_service.get_projects())
+
 
 @router.get("", response_model=ProjectsList, summary="Get all projects", operation_id="list_projects")
 async def get_projects():
@@ -15,5 +18,4 @@ async def get_projects():
     Returns information about current and past projects including status,
     tech stack, and links to demos or repositories.
     """
-    projects = projects_service.get_projects()
-    return ProjectsList(projects=projects, total=len(projects))
\ No newline at end of file
+    return Response(content=_PROJECTS_BODY, media_type="application/json")
\ No newline at end of file
@@ -1,11 +1,19 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 from typing import Optional
 
-from app.models import Skill, SkillsList
-from app.services import skills_service, create_error_response
+from app.json_codec import json_list_body
+from app.models import SkillsList
+from app.services import data_service, skills_service
 
 router = APIRouter(prefix="/skills", tags=["Skills"])
 
+_ALL_SKILLS_BODY = json_list_body("skills", skills_service.get_skills())
+_NO_SKILLS_BODY = json_list_body("skills", ())
+_SKILLS_BODY_BY_DOMAIN = {
+    domain: json_list_body("skills", skills_service.get_skills(domain))
+    for domain in data_service.skills_by_domain
+}
+
 
 @router.get("", response_model=SkillsList, summary="Get all skills", operation_id="list_skills")
 async def get_skills(
@@ -16,5 +24,8 @@ async def get_skills(
     
     Available domains: Cloud, Low-Code, Collaboration, AI, Security, DevOps, Quality, Architecture, Development, Strategy
     """
-    skills = skills_service.get_skills(domain=domain)
-    return SkillsList(skills=skills, total=len(skills))
\ No newline at end of file
+    if domain:
+        body = _SKILLS_BODY_BY_DOMAIN.get(domain.lower(), _NO_SKILLS_BODY)
+    else:
+        body = _ALL_SKILLS_BODY
+    return Response(content=body, media_type="application/json")
\ No newline at end of file
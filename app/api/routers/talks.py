@@ -1,20 +1,32 @@
-from fastapi import APIRouter, Query, HTTPException, Path, Request
+from fastapi import APIRouter, Depends, Query, HTTPException, Path, Request, Response
+import os
 from typing import Optional, List
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
-from app.models import Talk, TalksList, TalkQuestion, TalkQuestionResponse
-from app.services import talks_service, create_error_response, create_error_response
+from app.json_codec import json_list_body
+from app.models import ErrorResponse, Talk, TalksList, TalkQuestion, TalkQuestionResponse
+from app.rate_limit import TokenBucket
+from app.services import data_service, talks_service
 
-# Rate limiter instance
-limiter = Limiter(key_func=get_remote_address)
+# Token bucket rate limiters
+talks_limit = TokenBucket(30)  # Allow 30 requests per minute
+question_limit = TokenBucket(3)  # Strict rate limit for question submission
 router = APIRouter(prefix="/talks", tags=["Talks"])
 
+# Talk IDs are lowercase slugs; reject anything else before the handler runs
+TALK_ID_PATTERN = r"^[a-z0-9-]+$"
+TALK_ID_MAX_LENGTH = 128
 
-@router.get("", response_model=TalksList, summary="Get all talks", operation_id="list_talks")
-@limiter.limit("30/minute")  # Allow 30 requests per minute
+_ALL_TALKS_BODY = json_list_body("talks", talks_service.get_talks())
+_NO_TALKS_BODY = json_list_body("talks", ())
+_TALKS_BODY_BY_YEAR = {
+    year: json_list_body("talks", talks_service.get_talks(year))
+    for year in data_service.talks_by_year
+}
+
+
+@router.get("", response_model=TalksList, summary="Get all talks", operation_id="list_talks",
+            dependencies=[Depends(talks_limit)])
 async def get_talks(
-    request: Request,
     year: Optional[int] = Query(None, description="Filter talks by year")
 ):
     """
@@ -24,15 +36,16 @@ async def get_talks(
     
     **Rate limit:** 30 requests per minute per IP address
     """
-    talks = talks_service.get_talks(year=year)
-    return TalksList(talks=talks, total=len(talks))
+    body = _TALKS_BODY_BY_YEAR.get(year, _NO_TALKS_BODY) if year else _ALL_TALKS_BODY
+    return Response(content=body, media_type="application/json")
 
 
-@router.post("/{talk_id}/questions", response_model=TalkQuestionResponse, summary="Submit question for talk", operation_id="submit_talk_question")
-@limiter.limit("3/minute")  # Strict rate limit for question submission
+@router.post("/{talk_id}/questions", response_model=TalkQuestionResponse, summary="Submit question for talk", operation_id="submit_talk_question",
+             responses={404: {"model": ErrorResponse, "description": "Talk not found"}})
 async def submit_talk_question(
     request: Request,
-    talk_id: str = Path(..., description="The ID of the talk to ask about"),
+    talk_id: str = Path(..., description="The ID of the talk to ask about",
+                        pattern=TALK_ID_PATTERN, max_length=TALK_ID_MAX_LENGTH),
     question: TalkQuestion = ...
 ):
     """
@@ -45,47 +58,42 @@ async def submit_talk_question(
     
     **Rate limit:** 3 questions per minute per IP address to prevent spam
     """
-    result = talks_service.submit_question(talk_id, question.model_dump())
+    # Checked in the body rather than as a dependency so invalid (422) payloads don't spend tokens
+    await question_limit(request)
+    result = await talks_service.submit_question(talk_id, question)
     
     if not result:
-        error = create_error_response(
-            "not_found",
-            f"Talk with ID '{talk_id}' not found",
-            {"talk_id": talk_id}
-        )
-        raise HTTPException(status_code=404, detail=error.model_dump())
+        raise HTTPException(status_code=404, detail={
+            "error": {
+                "code": "not_found",
+                "message": f"Talk with ID '{talk_id}' not found",
+                "details": {"talk_id": talk_id}
+            }
+        })
     
-    return TalkQuestionResponse(**result)
+    # response_model validates and serializes the dict, no need to build the model first
+    return result
 
 
 @router.get("/{talk_id}/questions", summary="Get questions for talk (debug)", operation_id="get_talk_questions")
 async def get_talk_questions(
-    talk_id: str = Path(..., description="The ID of the talk to get questions for")
+    talk_id: str = Path(..., description="The ID of the talk to get questions for",
+                        pattern=TALK_ID_PATTERN, max_length=TALK_ID_MAX_LENGTH)
 ):
     """
     Debug endpoint to view submitted questions for a talk.
     """
-    import json
-    import os
-    from pathlib import Path
-    
-    # Get questions file path
-    questions_file = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "questions.json")
-    questions_file = os.path.abspath(questions_file)
-    
+    questions_file = data_service.questions_path
     debug_info = {
         "questions_file_path": questions_file,
         "file_exists": os.path.exists(questions_file),
         "questions": []
     }
     
-    if os.path.exists(questions_file):
+    if debug_info["file_exists"]:
         try:
-            with open(questions_file, 'r', encoding='utf-8') as f:
-                all_questions = json.load(f)
-                
-            # Filter questions for this talk
-            talk_questions = [q for q in all_questions if q.get('talk_id') == talk_id]
+            all_questions, questions_by_talk = data_service.questions_snapshot()
+            talk_questions = questions_by_talk.get(talk_id, [])
             debug_info["questions"] = talk_questions
             debug_info["total_questions"] = len(all_questions)
             debug_info["talk_questions"] = len(talk_questions)
@@ -10,7 +10,8 @@ class Settings:
     # CORS settings for production
     cors_origins: list = [
         "https://m365princess.com",
-        "https://www.m365princess.com"
+        "https://www.m365princess.com",
+        "https://api.m365princess.com"
     ]
     
     # Security
@@ -0,0 +1,28 @@
+"""JSON encoding helpers backed by orjson, with a stdlib fallback."""
+
+import json
+from typing import Any, Sequence
+
+try:
+    import orjson
+except ImportError:  # Keep the API importable where orjson wheels aren't available
+    orjson = None
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_list_body(key: str, items: Sequence[Any]) -> bytes:
+    """Encode a ``{key: items, "total": len(items)}`` list response body."""
+    return json_dumps({key: items, "total": len(items)})
\ No newline at end of file
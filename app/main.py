@@ -1,13 +1,28 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+from functools import lru_cache
+from contextlib import asynccontextmanager
 
 from app.api.routers import profile, skills, talks, projects, debug
+from app.config import settings
+from app.json_codec import json_dumps
+from app.services import talks_service
+
+# Served by the custom routes below instead of FastAPI's built-in ones
+OPENAPI_URL = "/openapi.json"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the question writer for the lifetime of the app."""
+    await talks_service.question_writer.start()
+    yield
+    await talks_service.question_writer.stop()
+
 
 # OpenAPI configuration
 app = FastAPI(
@@ -49,27 +64,15 @@ of FastAPI best practices.
         "showExtensions": True,
         "showCommonExtensions": True,
     },
-    docs_url="/docs",
-    openapi_url="/openapi.json"
+    docs_url=None,
+    openapi_url=None,
+    lifespan=lifespan
 )
 
-# Rate limiting configuration
-limiter = Limiter(key_func=get_remote_address)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
-# Add rate limiting middleware
-app.add_middleware(SlowAPIMiddleware)
-
 # Add CORS middleware for public access
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://m365princess.com",
-        "https://www.m365princess.com",
-        "https://api.m365princess.com",
-        "*"  # Remove this in production for better security
-    ],
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST"],  # Now allowing POST for talk questions
     allow_headers=["*"],
@@ -83,20 +86,27 @@ app.include_router(profile.router)
 app.include_router(skills.router)
 app.include_router(talks.router)
 app.include_router(projects.router)
-app.include_router(debug.router)
+
+# Debug endpoints expose file system details, so only mount them when DEBUG=true
+if settings.debug:
+    app.include_router(debug.router)
 
 
 @app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint that redirects to the API documentation."""
-    from fastapi.responses import RedirectResponse
     return RedirectResponse(url="/docs")
 
 
+# Pre-encoded health body; a fresh Response is still built per request because
+# middleware appends headers to the response's header list in place
+_HEALTH_BODY = b'{"status":"healthy","service":"luise-api"}'
+
+
 @app.get("/health", include_in_schema=False)
 async def health_check():
     """Simple health check endpoint for monitoring."""
-    return {"status": "healthy", "service": "luise-api"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Configure custom Swagger UI with pink theme
@@ -105,8 +115,6 @@ def custom_openapi():
     if app.openapi_schema:
         return app.openapi_schema
     
-    from fastapi.openapi.utils import get_openapi
-    
     openapi_schema = get_openapi(
         title="Luise API",
         version="1.0.0",
@@ -146,14 +154,25 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+
+@lru_cache(maxsize=None)
+def _openapi_bytes() -> bytes:
+    """OpenAPI schema encoded once; routes only change at startup."""
+    return json_dumps(app.openapi())
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json():
+    """Serve the cached OpenAPI schema."""
+    return Response(content=_openapi_bytes(), media_type="application/json")
+
 # Add custom CSS to Swagger UI
 @app.get("/docs", response_class=HTMLResponse, include_in_schema=False)  
 async def custom_swagger_ui_html():
     """Custom Swagger UI with pink theme."""
-    from fastapi.openapi.docs import get_swagger_ui_html
-    
     return get_swagger_ui_html(
-        openapi_url=app.openapi_url,
+        openapi_url=OPENAPI_URL,
         title=f"{app.title} - Interactive API Documentation",
-        swagger_css_url="/static/swagger-custom.css"
+        swagger_css_url="/static/swagger-custom.css",
+        swagger_ui_parameters=app.swagger_ui_parameters
     )
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""One-off migration of a legacy questions.json into questions.jsonl.
+
+Run once before starting the API (start.py does this before spawning workers):
+
+    python -m app.migrate_questions
+"""
+
+from app.services import data_service, migrate_questions_json
+
+
+def main() -> None:
+    legacy_file = data_service.data_dir / "questions.json"
+    migrated = migrate_questions_json(legacy_file, data_service.questions_file)
+    if migrated:
+        print(f"Migrated {migrated} question(s) from {legacy_file} to {data_service.questions_file}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
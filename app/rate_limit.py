@@ -0,0 +1,63 @@
+"""Lightweight in-process token bucket rate limiting."""
+
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from fastapi import HTTPException, Request
+
+
+def client_ip(request: Request) -> str:
+    """Client IP of the connection.
+    
+    X-Forwarded-For is deliberately not read here: clients control its first
+    hop. Behind a reverse proxy, uvicorn's proxy headers support (trusting
+    only ``FORWARDED_ALLOW_IPS``) resolves the real client into ``request.client``.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+class TokenBucket:
+    """Per-client token bucket usable as a FastAPI dependency.
+    
+    Each client IP gets ``capacity`` tokens which refill continuously at
+    ``capacity / per_seconds`` tokens per second; every request spends one.
+    Buckets are kept in LRU order and capped at ``max_clients`` so memory
+    stays bounded; an evicted client simply starts again with a full bucket.
+    """
+    
+    def __init__(self, capacity: int, per_seconds: float = 60.0, max_clients: int = 100_000):
+        self.capacity = float(capacity)
+        self.per_seconds = per_seconds
+        self.rate = capacity / per_seconds
+        self.max_clients = max_clients
+        # client key -> (tokens, last_refill), least recently seen first
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        # Rejections are the hot path under abuse, so build the error body once
+        self.error_detail = {
+            "error": {
+                "code": "rate_limited",
+                "message": f"Rate limit exceeded: {capacity} per {int(per_seconds)} seconds",
+                "details": None
+            }
+        }
+    
+    def allow(self, key: str) -> bool:
+        """Spend a token for ``key``; return False if none are left."""
+        now = time.monotonic()
+        buckets = self.buckets
+        bucket = buckets.get(key)
+        if bucket is None:
+            tokens = self.capacity
+            if len(buckets) >= self.max_clients:
+                buckets.popitem(last=False)
+        else:
+            tokens = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+            buckets.move_to_end(key)
+        allowed = tokens >= 1.0
+        buckets[key] = (tokens - 1.0 if allowed else tokens, now)
+        return allowed
+    
+    async def __call__(self, request: Request) -> None:
+        if not self.allow(client_ip(request)):
+            raise HTTPException(status_code=429, detail=self.error_detail)
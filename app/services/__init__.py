@@ -1,148 +1,248 @@
-import json
+import asyncio
 import time
 import os
-from typing import Dict, List, Optional, Any
+import logging
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import defaultdict, OrderedDict
 
-from app.models import (
-    Profile, Quote, Skill, Talk, Project, 
-    ErrorDetail, ErrorResponse
-)
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; single-process dev servers don't need it
+    fcntl = None
+
+from app.json_codec import json_dumps, json_loads
+from app.models import Profile, Quote, Skill, Talk, Project, TalkQuestion
+
+logger = logging.getLogger(__name__)
 
 
 class DataService:
     """Service for loading and managing static data."""
     
     def __init__(self):
-        self.data_dir = Path(__file__).parent.parent / "data"
-        self._profile_data = None
-        self._skills_data = None
-        self._talks_data = None
-        self._projects_data = None
-        self._quotes_data = None
+        self.data_dir = (Path(__file__).parent.parent / "data").resolve()
+        self._questions_lock = threading.Lock()
+        self.set_questions_file(self.data_dir / "questions.jsonl")
+        self._load_all()
+    
+    def set_questions_file(self, path: Path) -> None:
+        """Read and write submitted questions at ``path`` (tests point this at a temp dir)."""
+        with self._questions_lock:
+            self.questions_file = path
+            self.questions_path = str(path)
+            self._questions_data: List[Dict[str, Any]] = []
+            self._questions_by_talk: Dict[str, List[Dict[str, Any]]] = {}
+            self._questions_mtime: Optional[int] = None
         
     def _load_json(self, filename: str) -> Any:
         """Load JSON data from file."""
-        with open(self.data_dir / filename, 'r') as f:
-            return json.load(f)
+        with open(self.data_dir / filename, 'rb') as f:
+            return json_loads(f.read())
     
-    @property
-    def profile_data(self) -> Dict[str, Any]:
-        if self._profile_data is None:
-            self._profile_data = self._load_json("profile.json")
-        return self._profile_data
+    def _load_jsonl(self, path: str) -> List[Any]:
+        """Load a JSON Lines file, one record per non-empty line."""
+        return list(iter_jsonl(path))
     
-    @property
-    def skills_data(self) -> List[Dict[str, Any]]:
-        if self._skills_data is None:
-            self._skills_data = self._load_json("skills.json")
-        return self._skills_data
+    def _load_all(self) -> None:
+        """Read every static data file once and build the validated models.
+        
+        The data never changes while the process runs, so request handlers
+        can hand out these shared instances instead of re-validating dicts,
+        and the routers encode their response bodies once at import.
+        """
+        self.profile_data: Dict[str, Any] = self._load_json("profile.json")
+        self.skills_data: List[Dict[str, Any]] = self._load_json("skills.json")
+        self.talks_data: List[Dict[str, Any]] = self._load_json("talks.json")
+        self.projects_data: List[Dict[str, Any]] = self._load_json("projects.json")
+        self.quotes_data: Dict[str, List[Dict[str, Any]]] = self._load_json("quotes.json")
+        
+        data = self.profile_data
+        profile_fields = {
+            "name": data["name"],
+            "role": data["role"],
+            "bio": data["bio"],
+            "location": data["location"],
+            "website": data.get("website"),
+            "linkedin": data.get("linkedin"),
+            "methods": data["methods"]
+        }
+        # Add default mode data
+        profile_fields.update(data["modes"]["default"])
+        
+        self.profile_model = Profile(**profile_fields)
+        self.quotes_models: Dict[str, Tuple[Quote, ...]] = {
+            topic: tuple(Quote(**q) for q in quotes)
+            for topic, quotes in self.quotes_data.items()
+        }
+        
+        # Validate once through the models, then keep plain JSON-mode dicts
+        # that can be encoded without another model pass
+        self.skills_dicts: Tuple[Dict[str, Any], ...] = tuple(
+            Skill(**s).model_dump(mode="json") for s in self.skills_data
+        )
+        self.talks_dicts: Tuple[Dict[str, Any], ...] = tuple(
+            Talk(**t).model_dump(mode="json") for t in self.talks_data
+        )
+        self.projects_dicts: Tuple[Dict[str, Any], ...] = tuple(
+            Project(**p).model_dump(mode="json") for p in self.projects_data
+        )
+        
+        # Lookup indexes so filtered requests are a single dict access
+        skills_by_domain: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for skill in self.skills_dicts:
+            skills_by_domain[skill["domain"].lower()].append(skill)
+        self.skills_by_domain: Dict[str, Tuple[Dict[str, Any], ...]] = {
+            domain: tuple(skills) for domain, skills in skills_by_domain.items()
+        }
+        talks_by_year: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for talk in self.talks_dicts:
+            talks_by_year[talk["year"]].append(talk)
+        self.talks_by_year: Dict[int, Tuple[Dict[str, Any], ...]] = {
+            year: tuple(talks) for year, talks in talks_by_year.items()
+        }
+        self.talk_ids = frozenset(talk["id"] for talk in self.talks_dicts)
     
-    @property
-    def talks_data(self) -> List[Dict[str, Any]]:
-        if self._talks_data is None:
-            self._talks_data = self._load_json("talks.json")
-        return self._talks_data
+    def _refresh_questions(self) -> None:
+        """Re-read questions.jsonl and rebuild the talk index if the file changed."""
+        try:
+            mtime = os.stat(self.questions_path).st_mtime_ns
+        except FileNotFoundError:
+            self._questions_data, self._questions_by_talk = [], {}
+            self._questions_mtime = None
+            return
+        if mtime != self._questions_mtime:
+            questions = self._load_jsonl(self.questions_path)
+            by_talk: Dict[str, List[Dict[str, Any]]] = {}
+            for q in questions:
+                by_talk.setdefault(q.get("talk_id"), []).append(q)
+            self._questions_data, self._questions_by_talk = questions, by_talk
+            self._questions_mtime = mtime
     
     @property
-    def projects_data(self) -> List[Dict[str, Any]]:
-        if self._projects_data is None:
-            self._projects_data = self._load_json("projects.json")
-        return self._projects_data
+    def questions_data(self) -> List[Dict[str, Any]]:
+        """Submitted questions, re-read only when questions.jsonl changes on disk."""
+        with self._questions_lock:
+            self._refresh_questions()
+            return self._questions_data
     
-    @property
-    def quotes_data(self) -> Dict[str, List[Dict[str, Any]]]:
-        if self._quotes_data is None:
-            self._quotes_data = self._load_json("quotes.json")
-        return self._quotes_data
+    def questions_snapshot(self) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """All submitted questions and the same questions grouped by talk_id.
+        
+        Both come from one refresh under the lock, so they always describe
+        the same version of questions.jsonl.
+        """
+        with self._questions_lock:
+            self._refresh_questions()
+            return self._questions_data, self._questions_by_talk
+
+
+class _RequestWindow:
+    """Ring of the most recent request timestamps for one rate limit key."""
+    
+    __slots__ = ("ring", "head")
+    
+    # Empty slot marker, older than any monotonic_ns() reading minus a window
+    NEVER = -(1 << 62)
+    
+    def __init__(self, size: int):
+        self.ring = [self.NEVER] * size
+        self.head = 0
+    
+    def check_and_record(self, now: int, time_window: int) -> bool:
+        """Return True if limited, otherwise record ``now`` and return False."""
+        head = self.head
+        ring = self.ring
+        # Oldest of the last max_requests requests is still inside the window
+        if ring[head] > now - time_window:
+            return True
+        
+        # Record current request over the oldest slot
+        ring[head] = now
+        head += 1
+        self.head = 0 if head == len(ring) else head
+        return False
 
 
 class RateLimitService:
-    """Simple in-memory rate limiting service."""
+    """Simple in-memory rate limiting service.
+    
+    Keeps a fixed-size ring of the last ``max_requests`` timestamps per key,
+    stored as integer ``time.monotonic_ns()`` readings so wall-clock jumps
+    cannot corrupt the window.
+    The slot at ``head`` is always the oldest of them, so a key is limited
+    exactly when that oldest timestamp is still inside the time window.
+    Keys are kept in LRU order and capped at ``max_keys``; an evicted key
+    simply starts again with an empty window.
+    """
     
-    def __init__(self, max_requests: int = 5, time_window: int = 60):
+    def __init__(self, max_requests: int = 5, time_window: int = 60, max_keys: int = 50_000):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests: Dict[str, deque] = defaultdict(deque)
+        self.time_window_ns = time_window * 1_000_000_000
+        self.max_keys = max_keys
+        # key -> request window, least recently seen first
+        self.requests: "OrderedDict[str, _RequestWindow]" = OrderedDict()
     
     def is_rate_limited(self, key: str) -> bool:
         """Check if a key is rate limited."""
-        now = time.time()
-        request_times = self.requests[key]
-        
-        # Remove old requests outside the time window
-        while request_times and request_times[0] <= now - self.time_window:
-            request_times.popleft()
-        
-        # Check if we're at the limit
-        if len(request_times) >= self.max_requests:
-            return True
-        
-        # Add current request
-        request_times.append(now)
-        return False
+        requests = self.requests
+        window = requests.get(key)
+        if window is None:
+            if len(requests) >= self.max_keys:
+                requests.popitem(last=False)
+            window = requests[key] = _RequestWindow(self.max_requests)
+        else:
+            requests.move_to_end(key)
+        return window.check_and_record(time.monotonic_ns(), self.time_window_ns)
     
     def get_remaining_requests(self, key: str) -> int:
         """Get remaining requests for a key."""
-        now = time.time()
-        request_times = self.requests[key]
+        window = self.requests.get(key)
+        if window is None:
+            return self.max_requests
         
-        # Remove old requests
-        while request_times and request_times[0] <= now - self.time_window:
-            request_times.popleft()
-        
-        return max(0, self.max_requests - len(request_times))
+        cutoff = time.monotonic_ns() - self.time_window_ns
+        return sum(1 for t in window.ring if t <= cutoff)
 
 
 class ProfileService:
     """Service for profile-related operations."""
     
+    # Fallback quote when no quotes exist for the requested or default topic
+    _FALLBACK_QUOTE = Quote(
+        text="It depends... but documentation usually helps.",
+        topic="general",
+        context="When in doubt, always a safe answer"
+    )
+    
     def __init__(self, data_service: DataService):
         self.data_service = data_service
     
     def get_profile(self) -> Profile:
         """Get basic profile information."""
-        data = self.data_service.profile_data
-        
-        # Base profile data
-        profile_data = {
-            "name": data["name"],
-            "role": data["role"],
-            "bio": data["bio"],
-            "location": data["location"],
-            "website": data.get("website"),
-            "linkedin": data.get("linkedin"),
-            "methods": data["methods"]
-        }
-        
-        # Add default mode data
-        mode_data = data["modes"]["default"]
-        profile_data.update(mode_data)
-        
-        return Profile(**profile_data)
+        return self.data_service.profile_model
 
     def get_quote(self, topic: Optional[str] = None) -> Quote:
         """Get a quote, optionally filtered by topic."""
-        quotes_data = self.data_service.quotes_data
+        quotes_models = self.data_service.quotes_models
         
-        if topic and topic in quotes_data:
-            quotes_list = quotes_data[topic]
+        if topic and topic in quotes_models:
+            quotes = quotes_models[topic]
         else:
             # Default to general quotes if topic not found
-            quotes_list = quotes_data.get("general", [])
+            quotes = quotes_models.get("general", ())
         
         # For demo, just return the first quote
-        if quotes_list:
-            quote_data = quotes_list[0]
-            return Quote(**quote_data)
+        if quotes:
+            return quotes[0]
         
-        # Fallback quote
-        return Quote(
-            text="It depends... but documentation usually helps.",
-            topic=topic or "general",
-            context="When in doubt, always a safe answer"
-        )
+        if topic and topic != "general":
+            return self._FALLBACK_QUOTE.model_copy(update={"topic": topic})
+        return self._FALLBACK_QUOTE
 
 
 class SkillsService:
@@ -151,16 +251,72 @@ class SkillsService:
     def __init__(self, data_service: DataService):
         self.data_service = data_service
     
-    def get_skills(self, domain: Optional[str] = None) -> List[Skill]:
-        """Get skills, optionally filtered by domain."""
-        skills_data = self.data_service.skills_data
-        
+    def get_skills(self, domain: Optional[str] = None) -> Tuple[Dict[str, Any], ...]:
+        """Get skills as validated dicts, optionally filtered by domain."""
         if domain:
-            filtered_skills = [s for s in skills_data if s["domain"].lower() == domain.lower()]
+            return self.data_service.skills_by_domain.get(domain.lower(), ())
+        return self.data_service.skills_dicts
+
+
+class QuestionWriter:
+    """Appends submitted questions to disk from a single background task.
+    
+    Handlers only enqueue records; the drain task batches whatever has
+    queued up into one append so disk latency stays off the request path.
+    Until ``start()`` runs (e.g. outside the app lifespan) records are
+    written synchronously instead. The target file is looked up on the
+    data service at each append, so ``set_questions_file`` moves reads and
+    writes together.
+    """
+    
+    def __init__(self, data_service: DataService):
+        self.data_service = data_service
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Start the background drain task on the running loop."""
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._drain())
+    
+    async def stop(self) -> None:
+        """Flush queued records and stop the drain task."""
+        if self.task is None:
+            return
+        await self.queue.join()
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.queue, self.task = None, None
+    
+    async def write(self, record: Dict[str, Any]) -> None:
+        """Queue a record for writing, or write it now if the task isn't running."""
+        if self.task is None:
+            self._append([record])
         else:
-            filtered_skills = skills_data
-        
-        return [Skill(**skill) for skill in filtered_skills]
+            self.queue.put_nowait(record)
+    
+    async def _drain(self) -> None:
+        queue = self.queue
+        while True:
+            records = [await queue.get()]
+            while not queue.empty():
+                records.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._append, records)
+            finally:
+                for _ in records:
+                    queue.task_done()
+    
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        path = self.data_service.questions_file
+        try:
+            append_jsonl(path, records)
+        except Exception:
+            # Continue anyway, don't fail the API call
+            logger.exception("Error saving %d question(s) to %s", len(records), path)
 
 
 class TalksService:
@@ -168,30 +324,18 @@ class TalksService:
     
     def __init__(self, data_service: DataService):
         self.data_service = data_service
+        self.question_writer = QuestionWriter(data_service)
     
-    def get_talks(self, year: Optional[int] = None) -> List[Talk]:
-        """Get talks, optionally filtered by year."""
-        talks_data = self.data_service.talks_data
-        
+    def get_talks(self, year: Optional[int] = None) -> Tuple[Dict[str, Any], ...]:
+        """Get talks as validated dicts, optionally filtered by year."""
         if year:
-            filtered_talks = [t for t in talks_data if t["year"] == year]
-        else:
-            filtered_talks = talks_data
-        
-        return [Talk(**talk) for talk in filtered_talks]
+            return self.data_service.talks_by_year.get(year, ())
+        return self.data_service.talks_dicts
     
-    def submit_question(self, talk_id: str, question_data: dict) -> dict:
+    async def submit_question(self, talk_id: str, question: TalkQuestion) -> dict:
         """Submit a question for a specific talk."""
-        import uuid
-        import json
-        import os
-        from datetime import datetime
-        
         # Verify talk exists
-        talks_data = self.data_service.talks_data
-        talk_exists = any(talk["id"] == talk_id for talk in talks_data)
-        
-        if not talk_exists:
+        if talk_id not in self.data_service.talk_ids:
             return None
             
         # Generate question ID and timestamp
@@ -202,48 +346,15 @@ class TalksService:
         question_record = {
             "id": question_id,
             "talk_id": talk_id,
-            "name": question_data["name"],
-            "email": question_data["email"], 
-            "question": question_data["question"],
+            "name": question.name,
+            "email": question.email,
+            "question": question.question,
             "submitted_at": timestamp,
             "status": "received"
         }
         
-        # Save to questions.json file
-        questions_file = os.path.join(os.path.dirname(__file__), "..", "data", "questions.json")
-        questions_file = os.path.abspath(questions_file)
-        
-        print(f"Attempting to save question to: {questions_file}")
-        print(f"Directory exists: {os.path.exists(os.path.dirname(questions_file))}")
-        print(f"File exists: {os.path.exists(questions_file)}")
-        print(f"Directory is writable: {os.access(os.path.dirname(questions_file), os.W_OK) if os.path.exists(os.path.dirname(questions_file)) else 'N/A'}")
-        
-        try:
-            # Load existing questions or create empty list
-            if os.path.exists(questions_file):
-                with open(questions_file, 'r', encoding='utf-8') as f:
-                    questions = json.load(f)
-                    print(f"Loaded {len(questions)} existing questions")
-            else:
-                questions = []
-                print("Creating new questions list")
-            
-            # Add new question
-            questions.append(question_record)
-            print(f"Added question {question_id}, total questions: {len(questions)}")
-            
-            # Save back to file
-            os.makedirs(os.path.dirname(questions_file), exist_ok=True)
-            with open(questions_file, 'w', encoding='utf-8') as f:
-                json.dump(questions, f, indent=2, ensure_ascii=False)
-            
-            print(f"Question saved successfully to {questions_file}")
-            
-        except Exception as e:
-            print(f"Error saving question: {e}")
-            # Continue anyway, don't fail the API call
-        
-        print(f"Question saved to {questions_file}: {question_id}")
+        # Queue for appending to questions.jsonl
+        await self.question_writer.write(question_record)
         
         return {
             "id": question_id,
@@ -261,21 +372,58 @@ class ProjectsService:
     def __init__(self, data_service: DataService):
         self.data_service = data_service
     
-    def get_projects(self) -> List[Project]:
-        """Get all projects."""
-        projects_data = self.data_service.projects_data
-        return [Project(**project) for project in projects_data]
+    def get_projects(self) -> Tuple[Dict[str, Any], ...]:
+        """Get all projects as validated dicts."""
+        return self.data_service.projects_dicts
 
 
-def create_error_response(code: str, message: str, details: Optional[Dict[str, Any]] = None) -> ErrorResponse:
-    """Helper function to create consistent error responses."""
-    return ErrorResponse(
-        error=ErrorDetail(
-            code=code,
-            message=message,
-            details=details
-        )
-    )
+def iter_jsonl(path: str):
+    """Yield records from a JSON Lines file, one per non-empty line."""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield json_loads(line)
+
+
+def migrate_questions_json(legacy_file: Path, questions_file: Path) -> int:
+    """One-time move of a legacy questions.json array into questions.jsonl.
+    
+    The records are appended to the JSON Lines file and the old file is
+    renamed to ``questions.json.migrated`` so this only ever runs once.
+    The whole step holds the questions file's flock, so concurrent runs
+    migrate the records exactly once. Returns the number of records moved.
+    """
+    if not legacy_file.exists():
+        return 0
+    with open(questions_file, 'ab') as out:
+        if fcntl is not None:
+            fcntl.flock(out, fcntl.LOCK_EX)
+        # Another process may have finished the migration while we waited
+        try:
+            with open(legacy_file, 'rb') as f:
+                records = json_loads(f.read())
+        except FileNotFoundError:
+            return 0
+        out.write(b"".join(json_dumps(record) + b"\n" for record in records))
+        out.flush()
+        try:
+            legacy_file.rename(legacy_file.with_name(legacy_file.name + ".migrated"))
+        except FileNotFoundError:
+            pass
+    return len(records)
+
+
+def append_jsonl(path: Union[str, Path], records: List[Dict[str, Any]]) -> None:
+    """Append records to a JSON Lines file.
+    
+    Takes an exclusive flock where available so concurrent workers never
+    interleave partial lines.
+    """
+    data = b"".join(json_dumps(record) + b"\n" for record in records)
+    with open(path, 'ab') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(data)
 
 
 # Global service instances
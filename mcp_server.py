@@ -10,9 +10,10 @@ Usage:
 """
 
 import asyncio
+import importlib.util
 import logging
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import httpx
 from mcp.server import Server
@@ -34,22 +35,33 @@ USER_AGENT = "luise-mcp-server/1.0.0"
 mcp_server = Server("luise-api")
 
 
+def _new_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by all tool calls."""
+    # HTTP/2 lets concurrent calls multiplex over one connection when h2 is installed
+    return httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        timeout=httpx.Timeout(30.0),
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        http2=importlib.util.find_spec("h2") is not None
+    )
+
+
+# Shared HTTP client so tool calls reuse pooled keep-alive connections
+# instead of paying a new TLS handshake each time; closed in main()
+_client = _new_client()
+
+
 async def make_api_request(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Make an HTTP request to the Luise API."""
-    url = f"{API_BASE_URL}{endpoint}"
-    
-    async with httpx.AsyncClient(
-        timeout=httpx.Timeout(30.0),
-        headers={"User-Agent": USER_AGENT}
-    ) as client:
-        try:
-            logger.info(f"Making API request to {url} with params: {params}")
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"API request failed: {e}")
-            raise
+    try:
+        logger.info(f"Making API request to {API_BASE_URL}{endpoint} with params: {params}")
+        response = await _client.get(endpoint, params=params)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError as e:
+        logger.error(f"API request failed: {e}")
+        raise
 
 
 # Tool definitions
@@ -136,168 +148,191 @@ TOOLS: List[Tool] = [
 ]
 
 
+# TOOLS never changes, so the listing result is built once
+_TOOLS_RESULT = ListToolsResult(tools=TOOLS)
+
+
 @mcp_server.list_tools()
 async def list_tools() -> ListToolsResult:
     """List available tools."""
-    return ListToolsResult(tools=TOOLS)
+    return _TOOLS_RESULT
+
+
+async def _handle_get_profile(arguments: Dict[str, Any]) -> CallToolResult:
+    """Format Luise's profile for the requested mode."""
+    mode = arguments.get("mode", "default")
+    unlock = arguments.get("unlock")
+    params = {"mode": mode}
+    if unlock:
+        params["unlock"] = unlock
+    
+    profile_data = await make_api_request("/profile", params)
+    
+    # Format the response
+    parts: List[str] = [f"**{profile_data.get('name', 'Luise')}**\n\n"]
+    if 'title' in profile_data:
+        parts.append(f"*{profile_data['title']}*\n\n")
+    if 'bio' in profile_data:
+        parts.append(f"{profile_data['bio']}\n\n")
+    if 'location' in profile_data:
+        parts.append(f"📍 **Location:** {profile_data['location']}\n")
+    if 'email' in profile_data:
+        parts.append(f"📧 **Email:** {profile_data['email']}\n")
+    
+    return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
+
+
+async def _handle_get_quote(arguments: Dict[str, Any]) -> CallToolResult:
+    """Format a quote, optionally on a topic."""
+    topic = arguments.get("topic")
+    params = {"topic": topic} if topic else {}
+    quote_data = await make_api_request("/profile/quote", params)
+    
+    parts: List[str] = ["💭 **Quote"]
+    if topic:
+        parts.append(f" on {topic}")
+    parts.append(":**\n\n")
+    
+    if 'quote' in quote_data:
+        parts.append(f'"{quote_data["quote"]}"')
+    if 'context' in quote_data:
+        parts.append(f"\n\n*Context: {quote_data['context']}*")
+    
+    return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
+
+
+async def _handle_search_skills(arguments: Dict[str, Any]) -> CallToolResult:
+    """Format skills, optionally filtered by domain."""
+    domain = arguments.get("domain")
+    params = {"domain": domain} if domain else {}
+    skills_data = await make_api_request("/skills", params)
+    
+    if not skills_data or 'skills' not in skills_data:
+        return CallToolResult(content=[TextContent(type="text", text="No skills data available.")])
+    
+    parts: List[str] = ["🚀 **Technical Skills**"]
+    if domain:
+        parts.append(f" (Domain: {domain})")
+    parts.append(":\n\n")
+    
+    for skill in skills_data['skills']:
+        parts.append(f"**{skill.get('name', 'Unknown')}**")
+        if 'level' in skill:
+            parts.append(f" - *{skill['level'].title()}*")
+        parts.append("\n")
+        if 'description' in skill:
+            parts.append(f"{skill['description']}\n")
+        parts.append("\n")
+    
+    return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
+
+
+async def _handle_get_talks(arguments: Dict[str, Any]) -> CallToolResult:
+    """Format talks, optionally filtered by year."""
+    year = arguments.get("year")
+    params = {"year": year} if year else {}
+    talks_data = await make_api_request("/talks", params)
+    
+    if not talks_data or 'talks' not in talks_data:
+        return CallToolResult(content=[TextContent(type="text", text="No talks data available.")])
+    
+    parts: List[str] = ["🎤 **Speaking Engagements FROM LUISE'S API DATABASE**"]
+    if year:
+        parts.append(f" ({year})")
+    parts.append(":\n\n")
+    
+    if not talks_data['talks']:
+        parts.append(f"⚠️ **No talks found in database for {year if year else 'any year'}.**\n")
+        parts.append("**This data comes directly from the API - no additional talks exist.**\n")
+        return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
+    
+    for talk in talks_data['talks']:
+        parts.append(f"**{talk.get('title', 'Untitled Talk')}**\n")
+        if 'event' in talk:
+            parts.append(f"📍 {talk['event']}")
+            if 'date' in talk:
+                parts.append(f" • {talk['date']}")
+            parts.append("\n")
+        if 'description' in talk:
+            parts.append(f"{talk['description']}\n")
+        if 'id' in talk:
+            parts.append(f"*Use submit_question tool with talk_id: {talk['id']} to ask questions*\n")
+        parts.append("\n")
+    
+    parts.append(f"\n---\n**📊 Data Source:** Live API at api.m365princess.com\n**Total Results:** {len(talks_data['talks'])} talk(s)\n")
+    
+    return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
+
+
+async def _handle_get_projects(arguments: Dict[str, Any]) -> CallToolResult:
+    """Format the project portfolio."""
+    projects_data = await make_api_request("/projects")
+    
+    if not projects_data or 'projects' not in projects_data:
+        return CallToolResult(content=[TextContent(type="text", text="No projects data available.")])
+    
+    parts: List[str] = ["💻 **Project Portfolio:**\n\n"]
+    
+    for project in projects_data['projects']:
+        parts.append(f"**{project.get('name', 'Unnamed Project')}**\n")
+        if 'description' in project:
+            parts.append(f"{project['description']}\n")
+        if 'status' in project:
+            parts.append(f"Status: {project['status'].title()}\n")
+        parts.append("\n")
+    
+    return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
+
+
+async def _handle_submit_question(arguments: Dict[str, Any]) -> CallToolResult:
+    """Submit a question about a talk."""
+    talk_id = arguments.get("talk_id")
+    name = arguments.get("name")
+    email = arguments.get("email") 
+    question = arguments.get("question")
+    
+    if not all([talk_id, name, email, question]):
+        return CallToolResult(
+            content=[TextContent(type="text", text="Missing required parameters.")],
+            isError=True
+        )
+    
+    # Submit question via POST
+    question_data = {"name": name, "email": email, "question": question}
+    
+    response = await _client.post(
+        f"/talks/{talk_id}/questions",
+        json=question_data
+    )
+    response.raise_for_status()
+    result = response.json()
+    
+    parts: List[str] = ["✅ **Question submitted successfully!**\n\n"]
+    if 'question_id' in result:
+        parts.append(f"**Question ID:** {result['question_id']}\n")
+    parts.append(f"📋 **View questions:** {API_BASE_URL}/talks/{talk_id}/questions\n")
+    
+    return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
+
+
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[CallToolResult]]] = {
+    "get_profile": _handle_get_profile,
+    "get_quote": _handle_get_quote,
+    "search_skills": _handle_search_skills,
+    "get_talks": _handle_get_talks,
+    "get_projects": _handle_get_projects,
+    "submit_question": _handle_submit_question,
+}
 
 
 @mcp_server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     """Handle tool calls."""
     try:
-        if name == "get_profile":
-            mode = arguments.get("mode", "default")
-            unlock = arguments.get("unlock")
-            params = {"mode": mode}
-            if unlock:
-                params["unlock"] = unlock
-            
-            profile_data = await make_api_request("/profile", params)
-            
-            # Format the response
-            profile_text = f"**{profile_data.get('name', 'Luise')}**\n\n"
-            if 'title' in profile_data:
-                profile_text += f"*{profile_data['title']}*\n\n"
-            if 'bio' in profile_data:
-                profile_text += f"{profile_data['bio']}\n\n"
-            if 'location' in profile_data:
-                profile_text += f"📍 **Location:** {profile_data['location']}\n"
-            if 'email' in profile_data:
-                profile_text += f"📧 **Email:** {profile_data['email']}\n"
-            
-            return CallToolResult(content=[TextContent(type="text", text=profile_text)])
-            
-        elif name == "get_quote":
-            topic = arguments.get("topic")
-            params = {"topic": topic} if topic else {}
-            quote_data = await make_api_request("/profile/quote", params)
-            
-            quote_text = f"💭 **Quote"
-            if topic:
-                quote_text += f" on {topic}"
-            quote_text += ":**\n\n"
-            
-            if 'quote' in quote_data:
-                quote_text += f'"{quote_data["quote"]}"'
-            if 'context' in quote_data:
-                quote_text += f"\n\n*Context: {quote_data['context']}*"
-            
-            return CallToolResult(content=[TextContent(type="text", text=quote_text)])
-            
-        elif name == "search_skills":
-            domain = arguments.get("domain")
-            params = {"domain": domain} if domain else {}
-            skills_data = await make_api_request("/skills", params)
-            
-            if not skills_data or 'skills' not in skills_data:
-                return CallToolResult(content=[TextContent(type="text", text="No skills data available.")])
-                
-            skills_text = "🚀 **Technical Skills**"
-            if domain:
-                skills_text += f" (Domain: {domain})"
-            skills_text += ":\n\n"
-            
-            for skill in skills_data['skills']:
-                skills_text += f"**{skill.get('name', 'Unknown')}**"
-                if 'level' in skill:
-                    skills_text += f" - *{skill['level'].title()}*"
-                skills_text += "\n"
-                if 'description' in skill:
-                    skills_text += f"{skill['description']}\n"
-                skills_text += "\n"
-            
-            return CallToolResult(content=[TextContent(type="text", text=skills_text)])
-            
-        elif name == "get_talks":
-            year = arguments.get("year")
-            params = {"year": year} if year else {}
-            talks_data = await make_api_request("/talks", params)
-            
-            if not talks_data or 'talks' not in talks_data:
-                return CallToolResult(content=[TextContent(type="text", text="No talks data available.")])
-                
-            talks_text = "🎤 **Speaking Engagements FROM LUISE'S API DATABASE**"
-            if year:
-                talks_text += f" ({year})"
-            talks_text += ":\n\n"
-            
-            if not talks_data['talks']:
-                talks_text += f"⚠️ **No talks found in database for {year if year else 'any year'}.**\n"
-                talks_text += "**This data comes directly from the API - no additional talks exist.**\n"
-                return CallToolResult(content=[TextContent(type="text", text=talks_text)])
-            
-            for talk in talks_data['talks']:
-                talks_text += f"**{talk.get('title', 'Untitled Talk')}**\n"
-                if 'event' in talk:
-                    talks_text += f"📍 {talk['event']}"
-                    if 'date' in talk:
-                        talks_text += f" • {talk['date']}"
-                    talks_text += "\n"
-                if 'description' in talk:
-                    talks_text += f"{talk['description']}\n"
-                if 'id' in talk:
-                    talks_text += f"*Use submit_question tool with talk_id: {talk['id']} to ask questions*\n"
-                talks_text += "\n"
-            
-            talks_text += "\n---\n**📊 Data Source:** Live API at api.m365princess.com\n**Total Results:** " + str(len(talks_data['talks'])) + " talk(s)\n"
-            
-            return CallToolResult(content=[TextContent(type="text", text=talks_text)])
-            
-        elif name == "get_projects":
-            projects_data = await make_api_request("/projects")
-            
-            if not projects_data or 'projects' not in projects_data:
-                return CallToolResult(content=[TextContent(type="text", text="No projects data available.")])
-                
-            projects_text = "💻 **Project Portfolio:**\n\n"
-            
-            for project in projects_data['projects']:
-                projects_text += f"**{project.get('name', 'Unnamed Project')}**\n"
-                if 'description' in project:
-                    projects_text += f"{project['description']}\n"
-                if 'status' in project:
-                    projects_text += f"Status: {project['status'].title()}\n"
-                projects_text += "\n"
-            
-            return CallToolResult(content=[TextContent(type="text", text=projects_text)])
-            
-        elif name == "submit_question":
-            talk_id = arguments.get("talk_id")
-            name = arguments.get("name")
-            email = arguments.get("email") 
-            question = arguments.get("question")
-            
-            if not all([talk_id, name, email, question]):
-                return CallToolResult(
-                    content=[TextContent(type="text", text="Missing required parameters.")],
-                    isError=True
-                )
-            
-            # Submit question via POST
-            question_data = {"name": name, "email": email, "question": question}
-            
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),
-                headers={"User-Agent": USER_AGENT}
-            ) as client:
-                response = await client.post(
-                    f"{API_BASE_URL}/talks/{talk_id}/questions",
-                    json=question_data
-                )
-                response.raise_for_status()
-                result = response.json()
-            
-            success_text = "✅ **Question submitted successfully!**\n\n"
-            if 'question_id' in result:
-                success_text += f"**Question ID:** {result['question_id']}\n"
-            success_text += f"📋 **View questions:** {API_BASE_URL}/talks/{talk_id}/questions\n"
-            
-            return CallToolResult(content=[TextContent(type="text", text=success_text)])
-            
-        else:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
-            
+        return await handler(arguments)
     except Exception as e:
         logger.error(f"Error in tool '{name}': {e}")
         return CallToolResult(
@@ -306,6 +341,28 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
         )
 
 
+class ProfileServer:
+    """In-process access to the MCP tools, used by test_mcp.py and the Streamlit agent.
+    
+    Call ``initialize()`` and ``aclose()`` on the event loop that makes the
+    tool calls, since the shared HTTP client's connections belong to it.
+    """
+    
+    async def initialize(self) -> None:
+        """Make sure the shared HTTP client is open (e.g. after an earlier aclose)."""
+        global _client
+        if _client.is_closed:
+            _client = _new_client()
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Call a tool by name, exactly as an MCP client would."""
+        return await call_tool(name, arguments)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        await _client.aclose()
+
+
 async def main():
     """Run the MCP server."""
     from mcp.server.stdio import stdio_server
@@ -313,7 +370,7 @@ async def main():
     logger.info("Starting Luise API MCP Server...")
     logger.info(f"Server will connect to API at: {API_BASE_URL}")
     
-    async with stdio_server() as (read_stream, write_stream):
+    async with _client, stdio_server() as (read_stream, write_stream):
         await mcp_server.run(
             read_stream,
             write_stream,
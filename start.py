@@ -4,17 +4,30 @@
 import uvicorn
 import os
 
+from app.migrate_questions import main as migrate_questions
+
 if __name__ == "__main__":
     # Railway provides PORT, fallback to 8000 for local development
     port = int(os.environ.get("PORT", "8000"))
     host = os.environ.get("HOST", "0.0.0.0")
+    # Single worker unless WEB_CONCURRENCY is set explicitly: rate limits live in
+    # process memory, so N workers would allow N times the documented limits
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    
+    # Runs once here in the parent, never in each worker's import
+    migrate_questions()
     
-    print(f"Starting server on {host}:{port}")
+    print(f"Starting server on {host}:{port} with {workers} worker(s)")
     
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
+        workers=workers,
         reload=False,
-        access_log=True
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+        loop="auto",
+        http="auto",
+        # Per-request access logging serializes stdout writes; uvicorn still logs errors
+        access_log=False
     )
\ No newline at end of file
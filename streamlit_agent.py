@@ -1,23 +1,89 @@
 import streamlit as st
 import asyncio
+import atexit
 import json
+import re
+import threading
+from collections import deque
 from mcp_server import ProfileServer
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
+
+# Keyword -> intent; matched as plain substrings of the lowercased prompt
+INTENT_KEYWORDS = {
+    "profile": "profile", "about": "profile", "bio": "profile",
+    "skills": "skills", "skill": "skills",
+    "talks": "talks", "speaking": "talks", "presentations": "talks",
+    "projects": "projects", "work": "projects",
+    "quote": "quote",
+}
+# One precompiled alternation finds every keyword in a single pass (longest first)
+INTENT_RE = re.compile("|".join(
+    re.escape(keyword) for keyword in sorted(INTENT_KEYWORDS, key=len, reverse=True)
+))
+
+def match_intents(text):
+    """Return the set of intents whose keywords appear in lowercased text."""
+    return {INTENT_KEYWORDS[keyword] for keyword in INTENT_RE.findall(text)}
+
+# Intent -> (tool, reply prefix), checked in priority order before quotes
+ROUTES = (
+    ("profile", "get_profile", "Here's Luise's profile:"),
+    ("skills", "search_skills", "Here are Luise's skills:"),
+    ("talks", "get_talks", "Here are Luise's talks:"),
+    ("projects", "get_projects", "Here are Luise's projects:"),
+)
+# Quote topic named in the prompt as a whole word; the first one mentioned wins
+QUOTE_TOPIC_RE = re.compile(r"\b(python|ai)\b", re.IGNORECASE)
+# Chat history kept (and re-rendered on every rerun) is capped at this many messages
+MAX_MESSAGES = 100
+HELP_TEXT = "I can help you with information about:\n- 👤 Profile & Bio\n- 💼 Skills\n- 🎤 Talks & Presentations\n- 🚀 Projects\n- 💭 Inspirational Quotes\n\nWhat would you like to know?"
+
 st.set_page_config(page_title="Luise AI Assistant", page_icon="🤖")
 
 st.title("🤖 Luise Profile AI Assistant")
 st.write("Ask me anything about Luise's profile, skills, talks, or projects!")
 
-# Initialize MCP server
+# One event loop for the whole app, running in a background thread, so
+# reruns don't create a new loop per message and async state stays on one loop
+@st.cache_resource
+def get_event_loop():
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def run_async(coro):
+    """Run a coroutine on the shared background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+# Initialize MCP server on the background loop it will be used from, and
+# close it there when the process exits
 @st.cache_resource
 def get_mcp_server():
-    return ProfileServer()
+    server = ProfileServer()
+    run_async(server.initialize())
+    atexit.register(lambda: asyncio.run_coroutine_threadsafe(server.aclose(), get_event_loop()).result(timeout=5))
+    return server
 
 server = get_mcp_server()
 
+# Tool data is static, so repeat questions are answered from Streamlit's cache.
+# Arguments are passed as a JSON string to keep the cache key cheap to hash.
+@st.cache_data(ttl=24 * 60 * 60)
+def cached_tool(name, args_json="{}"):
+    result = run_async(server.call_tool(name, json.loads(args_json)))
+    text = result.content[0].text
+    if result.isError:
+        # Raising keeps failures out of the cache
+        raise RuntimeError(text)
+    return text
+
 # Chat interface
 if "messages" not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = deque(maxlen=MAX_MESSAGES)
 
 # Display chat history
 for message in st.session_state.messages:
@@ -34,45 +100,34 @@ if prompt := st.chat_input("Ask about Luise's profile..."):
     
     # Process query and get response
     with st.chat_message("assistant"):
-        response_placeholder = st.empty()
-        
-        # Simple keyword matching to tool calls
-        async def process_query():
-            if any(word in prompt.lower() for word in ["profile", "about", "bio"]):
-                result = await server.call_tool("get_profile", {})
-                return f"Here's Luise's profile:\n\n{result.content[0].text}"
+        # Simple keyword matching to tool calls; yields the intro before the
+        # tool runs, then the tool text line by line, so the reply appears early
+        def process_query():
+            lower = prompt.lower()
+            intents = match_intents(lower)
             
-            elif any(word in prompt.lower() for word in ["skills", "skill"]):
-                result = await server.call_tool("search_skills", {})
-                return f"Here are Luise's skills:\n\n{result.content[0].text}"
+            for intent, tool, prefix in ROUTES:
+                if intent in intents:
+                    yield f"{prefix}\n\n"
+                    yield from cached_tool(tool).splitlines(keepends=True)
+                    return
             
-            elif any(word in prompt.lower() for word in ["talks", "speaking", "presentations"]):
-                result = await server.call_tool("get_talks", {})
-                return f"Here are Luise's talks:\n\n{result.content[0].text}"
+            if "quote" in intents:
+                match = QUOTE_TOPIC_RE.search(prompt)
+                topic = match.group(1).lower() if match else "general"
+                yield "Here's a quote for you:\n\n"
+                yield from cached_tool("get_quote", json.dumps({"topic": topic})).splitlines(keepends=True)
+                return
             
-            elif any(word in prompt.lower() for word in ["projects", "work"]):
-                result = await server.call_tool("get_projects", {})
-                return f"Here are Luise's projects:\n\n{result.content[0].text}"
-            
-            elif "quote" in prompt.lower():
-                topic = "general"
-                if "python" in prompt.lower():
-                    topic = "python"
-                elif "ai" in prompt.lower():
-                    topic = "ai"
-                
-                result = await server.call_tool("get_quote", {"topic": topic})
-                return f"Here's a quote for you:\n\n{result.content[0].text}"
-            
-            else:
-                return "I can help you with information about:\n- 👤 Profile & Bio\n- 💼 Skills\n- 🎤 Talks & Presentations\n- 🚀 Projects\n- 💭 Inspirational Quotes\n\nWhat would you like to know?"
+            yield HELP_TEXT
         
-        try:
-            response = asyncio.run(process_query())
-        except Exception as e:
-            response = f"Sorry, I encountered an error: {str(e)}"
+        def stream_response():
+            try:
+                yield from process_query()
+            except Exception as e:
+                yield f"Sorry, I encountered an error: {str(e)}"
         
-        response_placeholder.markdown(response)
+        response = st.write_stream(stream_response())
         st.session_state.messages.append({"role": "assistant", "content": response})
 
 # Sidebar with available tools
@@ -86,5 +141,12 @@ with st.sidebar:
     st.write("- ❓ Submit Question")
     
     if st.button("Clear Chat"):
-        st.session_state.messages = []
+        st.session_state.messages = deque(maxlen=MAX_MESSAGES)
+        st.rerun()
+    
+    if st.button("Reconnect Tools"):
+        # Close the cached server's connections and build a fresh one on the next run
+        run_async(server.aclose())
+        get_mcp_server.clear()
+        cached_tool.clear()
         st.rerun()
\ No newline at end of file
@@ -0,0 +1,60 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services import data_service
+
+
+@pytest.fixture(scope="session", autouse=True)
+def questions_file(tmp_path_factory):
+    """Store questions submitted by tests in a temp file instead of app/data."""
+    original = data_service.questions_file
+    path = tmp_path_factory.mktemp("data") / "questions.jsonl"
+    data_service.set_questions_file(path)
+    yield path
+    data_service.set_questions_file(original)
+
+
+@pytest.fixture(scope="session")
+def client(questions_file):
+    """One TestClient for the whole session; the context manager runs the app lifespan once.
+    
+    Redirects aren't followed by default since only the root endpoint redirects.
+    """
+    with TestClient(app, follow_redirects=False) as c:
+        yield c
+
+
+def _get_json(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def all_skills(client):
+    """Unfiltered /skills response body, fetched once."""
+    return _get_json(client, "/skills")
+
+
+@pytest.fixture(scope="session")
+def all_talks(client):
+    """Unfiltered /talks response body, fetched once."""
+    return _get_json(client, "/talks")
+
+
+@pytest.fixture(scope="session")
+def all_projects(client):
+    """/projects response body, fetched once."""
+    return _get_json(client, "/projects")
+
+
+@pytest.fixture(scope="session")
+def talk_ids(all_talks):
+    """IDs of all talks."""
+    return [talk["id"] for talk in all_talks["talks"]]
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run anyio-marked async tests on asyncio only."""
+    return "asyncio"
\ No newline at end of file
@@ -1,11 +1,12 @@
+import asyncio
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+from unittest.mock import patch
+from app.api.routers.profile import quote_limit
 from app.main import app
 
-client = TestClient(app)
 
-
-def test_profile_endpoint():
+def test_profile_endpoint(client):
     """Test profile endpoint returns correct structure and data."""
     response = client.get("/profile")
     assert response.status_code == 200
@@ -28,11 +29,9 @@ def test_profile_endpoint():
     assert len(data["methods"]) > 0
 
 
-def test_skills_get_all():
+def test_skills_get_all(all_skills):
     """Test getting all skills."""
-    response = client.get("/skills")
-    assert response.status_code == 200
-    data = response.json()
+    data = all_skills
     
     assert "skills" in data
     assert "total" in data
@@ -48,21 +47,25 @@ def test_skills_get_all():
         assert "level" in skill
 
 
-def test_skills_filter_by_domain():
-    """Test filtering skills by domain."""
-    response = client.get("/skills?domain=AI")
+@pytest.mark.parametrize("domain", ["AI", "Cloud", "devops"])
+def test_skills_filter_by_domain(client, all_skills, domain):
+    """Test filtering skills by domain (case-insensitive)."""
+    response = client.get(f"/skills?domain={domain}")
     assert response.status_code == 200
     data = response.json()
     
     assert "skills" in data
     assert "total" in data
     
-    # All returned skills should be in AI domain
-    for skill in data["skills"]:
-        assert skill["domain"] == "AI"
+    # Only that domain, and exactly the skills in it, should be returned
+    assert {s["domain"].lower() for s in data["skills"]} == {domain.lower()}
+    expected = [s for s in all_skills["skills"] if s["domain"].lower() == domain.lower()]
+    assert expected
+    assert data["skills"] == expected
+    assert data["total"] == len(expected)
 
 
-def test_skills_filter_nonexistent_domain():
+def test_skills_filter_nonexistent_domain(client):
     """Test filtering skills by non-existent domain returns empty list."""
     response = client.get("/skills?domain=NonExistent")
     assert response.status_code == 200
@@ -74,11 +77,9 @@ def test_skills_filter_nonexistent_domain():
     assert data["total"] == 0
 
 
-def test_talks_get_all():
+def test_talks_get_all(all_talks):
     """Test getting all talks."""
-    response = client.get("/talks")
-    assert response.status_code == 200
-    data = response.json()
+    data = all_talks
     
     assert "talks" in data
     assert "total" in data
@@ -94,21 +95,24 @@ def test_talks_get_all():
         assert "year" in talk
 
 
-def test_talks_filter_by_year():
+@pytest.mark.parametrize("year", [2025, 2026])
+def test_talks_filter_by_year(client, all_talks, year):
     """Test filtering talks by year."""
-    response = client.get("/talks?year=2025")
+    response = client.get(f"/talks?year={year}")
     assert response.status_code == 200
     data = response.json()
     
     assert "talks" in data
     assert "total" in data
     
-    # All returned talks should be from 2025
-    for talk in data["talks"]:
-        assert talk["year"] == 2025
+    # Only that year, and exactly the talks from it, should be returned
+    assert {t["year"] for t in data["talks"]} <= {year}
+    expected = [t for t in all_talks["talks"] if t["year"] == year]
+    assert data["talks"] == expected
+    assert data["total"] == len(expected)
 
 
-def test_talks_filter_nonexistent_year():
+def test_talks_filter_nonexistent_year(client):
     """Test filtering talks by non-existent year returns empty list."""
     response = client.get("/talks?year=1999")
     assert response.status_code == 200
@@ -120,14 +124,10 @@ def test_talks_filter_nonexistent_year():
     assert data["total"] == 0
 
 
-def test_submit_talk_question():
+def test_submit_talk_question(client, talk_ids):
     """Test submitting a question for an existing talk."""
-    # First get all talks to find a valid talk ID
-    talks_response = client.get("/talks")
-    talks_data = talks_response.json()
-    assert len(talks_data["talks"]) > 0
-    
-    talk_id = talks_data["talks"][0]["id"]
+    assert len(talk_ids) > 0
+    talk_id = talk_ids[0]
     
     question_data = {
         "name": "Test User",
@@ -147,7 +147,7 @@ def test_submit_talk_question():
     assert data["status"] == "received"
 
 
-def test_submit_question_invalid_talk():
+def test_submit_question_invalid_talk(client):
     """Test submitting a question for a non-existent talk returns 404."""
     question_data = {
         "name": "Test User", 
@@ -159,29 +159,40 @@ def test_submit_question_invalid_talk():
     assert response.status_code == 404
     data = response.json()
     assert "detail" in data
+    assert data["detail"]["error"]["code"] == "not_found"
+    assert data["detail"]["error"]["details"] == {"talk_id": "nonexistent-talk"}
 
 
-def test_submit_question_validation():
-    """Test question validation requirements."""
-    # Test missing required fields
-    response = client.post("/talks/any-talk/questions", json={})
-    assert response.status_code == 422
-    
-    # Test short question (less than 10 characters)
-    short_question = {
+def test_submit_question_malformed_talk_id(client):
+    """Test malformed talk IDs are rejected before the talk lookup."""
+    question_data = {
         "name": "Test User",
-        "email": "test@example.com", 
-        "question": "Too short"
+        "email": "test@example.com",
+        "question": "This is a test question."
     }
-    response = client.post("/talks/any-talk/questions", json=short_question)
+    
+    response = client.post("/talks/Not_A_Slug!/questions", json=question_data)
+    assert response.status_code == 422
+    
+    response = client.post(f"/talks/{'a' * 129}/questions", json=question_data)
     assert response.status_code == 422
 
 
-def test_projects_get_all():
+@pytest.mark.parametrize("payload", [
+    # Missing required fields
+    {},
+    # Short question (less than 10 characters)
+    {"name": "Test User", "email": "test@example.com", "question": "Too short"},
+], ids=["missing-fields", "short-question"])
+def test_submit_question_validation(client, payload):
+    """Test question validation requirements."""
+    response = client.post("/talks/any-talk/questions", json=payload)
+    assert response.status_code == 422
+
+
+def test_projects_get_all(all_projects):
     """Test getting all projects."""
-    response = client.get("/projects")
-    assert response.status_code == 200
-    data = response.json()
+    data = all_projects
     
     assert "projects" in data
     assert "total" in data
@@ -198,7 +209,7 @@ def test_projects_get_all():
         assert "tech_stack" in project
 
 
-def test_health_check():
+def test_health_check(client):
     """Test the health endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -206,9 +217,45 @@ def test_health_check():
     assert data["status"] == "healthy"
 
 
-def test_root_endpoint_serves_docs():
+def test_root_endpoint_serves_docs(client):
     """Test the root endpoint serves swagger docs."""
-    response = client.get("/")
+    response = client.get("/", follow_redirects=True)
     assert response.status_code == 200
     # Root now serves the swagger UI directly
-    assert "swagger" in response.text.lower() or "openapi" in response.text.lower()
\ No newline at end of file
+    assert "swagger" in response.text.lower() or "openapi" in response.text.lower()
+
+
+@pytest.fixture
+def fresh_quote_limit():
+    """Empty the shared quote bucket around a test and stop its clock.
+    
+    Only the rate limiter's reference to ``time`` is replaced, so the
+    bucket can't refill mid-test while the event loop keeps real time.
+    """
+    quote_limit.buckets.clear()
+    with patch("app.rate_limit.time") as clock:
+        clock.monotonic.return_value = 1000.0
+        yield quote_limit
+    quote_limit.buckets.clear()
+
+
+def test_quote_rate_limit(client, fresh_quote_limit):
+    """Test the quote endpoint rejects requests once the bucket is empty."""
+    for _ in range(30):
+        assert client.get("/profile/quotes").status_code == 200
+    
+    response = client.get("/profile/quotes")
+    assert response.status_code == 429
+    assert response.json()["detail"]["error"]["code"] == "rate_limited"
+
+
+@pytest.mark.anyio
+async def test_smoke_endpoints_concurrently():
+    """Test the main read endpoints together through one in-process async client."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        responses = await asyncio.gather(
+            ac.get("/profile"), ac.get("/skills"), ac.get("/talks"), ac.get("/projects")
+        )
+    
+    assert all(r.status_code == 200 for r in responses)
\ No newline at end of file
@@ -0,0 +1,23 @@
+from starlette.requests import Request
+
+from app.rate_limit import client_ip
+
+
+def _request(headers=(), client=("203.0.113.7", 1234)):
+    scope = {
+        "type": "http",
+        "headers": [(k.encode(), v.encode()) for k, v in headers],
+        "client": client,
+    }
+    return Request(scope)
+
+
+def test_client_ip_ignores_spoofed_forwarded_for():
+    """Test a client-supplied X-Forwarded-For can't change the rate limit key."""
+    request = _request(headers=[("x-forwarded-for", "198.51.100.1, 10.0.0.1")])
+    assert client_ip(request) == "203.0.113.7"
+
+
+def test_client_ip_without_client():
+    """Test requests without connection info share one key."""
+    assert client_ip(_request(client=None)) == "unknown"
\ No newline at end of file
@@ -0,0 +1,94 @@
+import asyncio
+from unittest.mock import patch
+
+from app.services import (
+    DataService, QuestionWriter, RateLimitService, append_jsonl, iter_jsonl, migrate_questions_json
+)
+
+SECOND = 1_000_000_000
+
+
+def test_rate_limit_service_blocks_after_max_requests():
+    """Test keys are limited once max_requests fall inside the window."""
+    service = RateLimitService(max_requests=3, time_window=60)
+    
+    with patch("app.services.time.monotonic_ns", return_value=1000 * SECOND):
+        assert [service.is_rate_limited("client") for _ in range(4)] == [False, False, False, True]
+        assert service.get_remaining_requests("client") == 0
+        assert service.get_remaining_requests("other") == 3
+
+
+def test_rate_limit_service_window_expiry():
+    """Test requests older than the window no longer count."""
+    service = RateLimitService(max_requests=2, time_window=60)
+    
+    with patch("app.services.time.monotonic_ns", return_value=1000 * SECOND):
+        service.is_rate_limited("client")
+    with patch("app.services.time.monotonic_ns", return_value=1030 * SECOND):
+        service.is_rate_limited("client")
+        assert service.is_rate_limited("client")
+    with patch("app.services.time.monotonic_ns", return_value=1060 * SECOND):
+        # First request expired, second still counts
+        assert service.get_remaining_requests("client") == 1
+        assert not service.is_rate_limited("client")
+        assert service.is_rate_limited("client")
+
+
+def test_rate_limit_service_evicts_least_recent_key():
+    """Test the number of tracked keys stays bounded."""
+    service = RateLimitService(max_requests=1, time_window=60, max_keys=2)
+    
+    with patch("app.services.time.monotonic_ns", return_value=1000 * SECOND):
+        service.is_rate_limited("a")
+        service.is_rate_limited("b")
+        service.is_rate_limited("a")
+        service.is_rate_limited("c")
+        assert list(service.requests) == ["a", "c"]
+
+
+def test_migrate_questions_json(tmp_path):
+    """Test a legacy questions.json array is appended to questions.jsonl once."""
+    legacy = tmp_path / "questions.json"
+    target = tmp_path / "questions.jsonl"
+    legacy.write_text('[{"id": "old"}]')
+    target.write_text('{"id": "new"}\n')
+    
+    assert migrate_questions_json(legacy, target) == 1
+    assert migrate_questions_json(legacy, target) == 0
+    
+    assert [q["id"] for q in iter_jsonl(str(target))] == ["new", "old"]
+    assert not legacy.exists()
+    assert (tmp_path / "questions.json.migrated").exists()
+
+
+def test_questions_snapshot_tracks_appends(tmp_path):
+    """Test the question list and talk index are refreshed together after an append."""
+    path = tmp_path / "questions.jsonl"
+    service = DataService()
+    service.set_questions_file(path)
+    assert service.questions_snapshot() == ([], {})
+    
+    append_jsonl(path, [{"id": "q1", "talk_id": "a"}, {"id": "q2", "talk_id": "b"}])
+    all_questions, by_talk = service.questions_snapshot()
+    
+    assert [q["id"] for q in all_questions] == ["q1", "q2"]
+    assert [q["id"] for q in by_talk["a"]] == ["q1"]
+
+
+def test_question_writer_flushes_on_stop(tmp_path):
+    """Test queued questions are all on disk once the writer stops."""
+    path = tmp_path / "questions.jsonl"
+    service = DataService()
+    service.set_questions_file(path)
+    writer = QuestionWriter(service)
+    
+    async def run():
+        await writer.start()
+        for i in range(5):
+            await writer.write({"id": f"q{i}"})
+        await writer.stop()
+    
+    asyncio.run(run())
+    
+    assert [q["id"] for q in iter_jsonl(str(path))] == [f"q{i}" for i in range(5)]
+    assert writer.task is None
\ No newline at end of file